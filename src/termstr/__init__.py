@@ -1,8 +1,27 @@
-from .const import ESCSEQ, Color
+from .const import (
+    BLINK,
+    BOLD,
+    DIM,
+    ESCSEQ,
+    INVISIBLE,
+    ITALIC,
+    REVERSE,
+    STRIKETHROUGH,
+    UNDERLINE,
+    Color,
+)
 from .models import Div, Span
 from .utils import cprint, erase_screen, error, reset_cursor, success, warn
 
 __all__ = [
+    "BOLD",
+    "DIM",
+    "ITALIC",
+    "UNDERLINE",
+    "BLINK",
+    "REVERSE",
+    "INVISIBLE",
+    "STRIKETHROUGH",
     "ESCSEQ",
     "Color",
     "Div",
@@ -1,4 +1,14 @@
 from enum import StrEnum, auto
+from functools import cached_property
+
+BOLD = 0b10000000
+DIM = 0b01000000
+ITALIC = 0b00100000
+UNDERLINE = 0b00010000
+BLINK = 0b00001000
+REVERSE = 0b00000100
+INVISIBLE = 0b00000010
+STRIKETHROUGH = 0b00000001
 
 ESCSEQ: dict[str, dict[str, str]] = {
     "erase": {"screen": "\u001b[2J"},
@@ -9,7 +19,7 @@ ESCSEQ: dict[str, dict[str, str]] = {
         "underline": "\u001b[24m",
         "blink": "\u001b[25m",
         "reverse": "\u001b[27m",
-        "invisible ": "\u001b[28m",
+        "invisible": "\u001b[28m",
         "strikethrough": "\u001b[29m",
         "foreground": "\u001b[39m",
         "background": "\u001b[49m",
@@ -22,7 +32,7 @@ ESCSEQ: dict[str, dict[str, str]] = {
         "underline": "\u001b[4m",
         "blink": "\u001b[5m",
         "reverse": "\u001b[7m",
-        "invisible ": "\u001b[8m",
+        "invisible": "\u001b[8m",
         "strikethrough": "\u001b[9m",
     },
     "foreground": {
@@ -57,3 +67,11 @@ class Color(StrEnum):
     MAGENTA = auto()
     CYAN = auto()
     WHITE = auto()
+
+    @cached_property
+    def foreground_seq(self) -> str:
+        return ESCSEQ["foreground"][self]
+
+    @cached_property
+    def background_seq(self) -> str:
+        return ESCSEQ["background"][self]
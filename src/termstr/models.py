@@ -1,9 +1,71 @@
 import copy
 from abc import ABC, abstractmethod
 from collections import deque
+from functools import lru_cache, reduce
+from operator import or_
 from typing import Any, Iterable, Iterator, Self
 
-from .const import ESCSEQ, Color
+from .const import (
+    BLINK,
+    BOLD,
+    DIM,
+    ESCSEQ,
+    INVISIBLE,
+    ITALIC,
+    REVERSE,
+    STRIKETHROUGH,
+    UNDERLINE,
+    Color,
+)
+
+_STYLE_NAMES: tuple[str, ...] = (
+    "bold",
+    "dim",
+    "italic",
+    "underline",
+    "blink",
+    "reverse",
+    "invisible",
+    "strikethrough",
+)
+
+
+def _build_style_tables() -> tuple[list[str], list[str]]:
+    """
+    Precompute the escape sequences wrapping a text for every possible
+    style byte. Bold and dim share the same reset sequence.
+    """
+    prefixes = []
+    suffixes = []
+    for style in range(256):
+        prefix = []
+        suffix = []
+        for bit, name in zip(range(7, -1, -1), _STYLE_NAMES):
+            if not (style >> bit) & 1:
+                continue
+            prefix.append(ESCSEQ["style"][name])
+            if name == "bold":
+                suffix.append(ESCSEQ["reset"]["bold/dim"])
+            elif name == "dim":
+                if not (style >> 7) & 1:
+                    suffix.append(ESCSEQ["reset"]["bold/dim"])
+            else:
+                suffix.append(ESCSEQ["reset"][name])
+        prefix.reverse()
+        prefixes.append("".join(prefix))
+        suffixes.append("".join(suffix))
+    return prefixes, suffixes
+
+
+_STYLE_PREFIX, _STYLE_SUFFIX = _build_style_tables()
+
+_PAD_SPACES: list[str] = [" " * i for i in range(256)]
+
+
+def _pad_str(n: int) -> str:
+    if n <= 0:
+        return ""
+    return _PAD_SPACES[n] if n < 256 else " " * n
 
 
 class AbstractBaseContainer(ABC):
@@ -30,99 +92,147 @@ class AbstractBaseContainer(ABC):
     For example, if `style` is set to `0b11000000`, it means that the
     bold and dim modes are turned on, while all other style attributes
     are turned off.
+
+    Methods that change any of the above return the instance they
+    changed, which may differ from `self` (see `Span.of`).
     """
 
+    __slots__ = ("_data", "_padding", "style", "foreground", "background")
+
     _data: Any
     _padding: tuple[int, int]
     style: int
     foreground: Color | None
     background: Color | None
 
+    def set(self, mask: int, *masks: int) -> Self:
+        """
+        Turn on every style bit in the masks, e.g. `set(BOLD | UNDERLINE)`
+        or `set(BOLD, UNDERLINE)`.
+        """
+        if masks:
+            mask |= reduce(or_, masks)
+        target = self._writable()
+        target.style |= mask & 0b11111111
+        return target
+
+    def unset(self, mask: int, *masks: int) -> Self:
+        """Turn off every style bit in the masks."""
+        if masks:
+            mask |= reduce(or_, masks)
+        target = self._writable()
+        target.style &= ~mask & 0b11111111
+        return target
+
     def set_bold(self) -> Self:
-        self.style |= 0b10000000
-        return self
+        target = self._writable()
+        target.style |= BOLD
+        return target
 
     def unset_bold(self) -> Self:
-        self.style &= 0b01111111
-        return self
+        target = self._writable()
+        target.style &= ~BOLD & 0b11111111
+        return target
 
     def set_dim(self) -> Self:
-        self.style |= 0b01000000
-        return self
+        target = self._writable()
+        target.style |= DIM
+        return target
 
     def unset_dim(self) -> Self:
-        self.style &= 0b10111111
-        return self
+        target = self._writable()
+        target.style &= ~DIM & 0b11111111
+        return target
 
     def set_italic(self) -> Self:
-        self.style |= 0b00100000
-        return self
+        target = self._writable()
+        target.style |= ITALIC
+        return target
 
     def unset_italic(self) -> Self:
-        self.style &= 0b11011111
-        return self
+        target = self._writable()
+        target.style &= ~ITALIC & 0b11111111
+        return target
 
     def set_underline(self) -> Self:
-        self.style |= 0b00010000
-        return self
+        target = self._writable()
+        target.style |= UNDERLINE
+        return target
 
     def unset_underline(self) -> Self:
-        self.style &= 0b11101111
-        return self
+        target = self._writable()
+        target.style &= ~UNDERLINE & 0b11111111
+        return target
 
     def set_blink(self) -> Self:
-        self.style |= 0b00001000
-        return self
+        target = self._writable()
+        target.style |= BLINK
+        return target
 
     def unset_blink(self) -> Self:
-        self.style &= 0b11110111
-        return self
+        target = self._writable()
+        target.style &= ~BLINK & 0b11111111
+        return target
 
     def set_reverse(self) -> Self:
-        self.style |= 0b00000100
-        return self
+        target = self._writable()
+        target.style |= REVERSE
+        return target
 
     def unset_reverse(self) -> Self:
-        self.style &= 0b11111011
-        return self
+        target = self._writable()
+        target.style &= ~REVERSE & 0b11111111
+        return target
 
     def set_invisible(self) -> Self:
-        self.style |= 0b00000010
-        return self
+        target = self._writable()
+        target.style |= INVISIBLE
+        return target
 
     def unset_invisible(self) -> Self:
-        self.style &= 0b11111101
-        return self
+        target = self._writable()
+        target.style &= ~INVISIBLE & 0b11111111
+        return target
 
     def set_strikethrough(self) -> Self:
-        self.style |= 0b00000001
-        return self
+        target = self._writable()
+        target.style |= STRIKETHROUGH
+        return target
 
     def unset_strikethrough(self) -> Self:
-        self.style &= 0b11111110
-        return self
+        target = self._writable()
+        target.style &= ~STRIKETHROUGH & 0b11111111
+        return target
 
     def set_foreground(self, color: Color) -> Self:
-        self.foreground = color
-        return self
+        target = self._writable()
+        target.foreground = color
+        return target
 
     def unset_foreground(self) -> Self:
-        self.foreground = None
-        return self
+        target = self._writable()
+        target.foreground = None
+        return target
 
     def set_background(self, color: Color) -> Self:
-        self.background = color
-        return self
+        target = self._writable()
+        target.background = color
+        return target
 
     def unset_background(self) -> Self:
-        self.background = None
-        return self
+        target = self._writable()
+        target.background = None
+        return target
 
     @abstractmethod
     def _data_len(self) -> int:
         """Length with no padding."""
         pass
 
+    def _writable(self) -> Self:
+        """Return the instance a mutator should modify."""
+        return self
+
     def __len__(self) -> int:
         return self._data_len() + self._padding[0] + self._padding[1]
 
@@ -134,71 +244,52 @@ class AbstractBaseContainer(ABC):
         if diff > 0:
             front = diff // 2
             back = diff - front
-            self._padding = (front, back)
+            target = self._writable()
+            target._padding = (front, back)
+            return target
         return self
 
     def ljust(self, width: int) -> Self:
         diff = width - self._data_len()
         if diff > 0:
-            self._padding = (0, diff)
+            target = self._writable()
+            target._padding = (0, diff)
+            return target
         return self
 
     def rjust(self, width: int) -> Self:
         diff = width - self._data_len()
         if diff > 0:
-            self._padding = (diff, 0)
+            target = self._writable()
+            target._padding = (diff, 0)
+            return target
         return self
 
     def _style(self, text: str) -> str:
-        result = deque(text)
-
-        is_bold = False
-        if (self.style >> 7) & 1:
-            result.appendleft(ESCSEQ["style"]["bold"])
-            result.append(ESCSEQ["reset"]["bold/dim"])
-            is_bold = True
-
-        if (self.style >> 6) & 1:
-            result.appendleft(ESCSEQ["style"]["dim"])
-            if not is_bold:
-                result.append(ESCSEQ["reset"]["bold/dim"])
-
-        if (self.style >> 5) & 1:
-            result.appendleft(ESCSEQ["style"]["italic"])
-            result.append(ESCSEQ["reset"]["italic"])
-
-        if (self.style >> 4) & 1:
-            result.appendleft(ESCSEQ["style"]["underline"])
-            result.append(ESCSEQ["reset"]["underline"])
-
-        if (self.style >> 3) & 1:
-            result.appendleft(ESCSEQ["style"]["blink"])
-            result.append(ESCSEQ["reset"]["blink"])
-
-        if (self.style >> 2) & 1:
-            result.appendleft(ESCSEQ["style"]["reverse"])
-            result.append(ESCSEQ["reset"]["reverse"])
-
-        if (self.style >> 1) & 1:
-            result.appendleft(ESCSEQ["style"]["invisible"])
-            result.append(ESCSEQ["reset"]["invisible"])
-
-        if self.style & 1:
-            result.appendleft(ESCSEQ["style"]["strikethrough"])
-            result.append(ESCSEQ["reset"]["strikethrough"])
+        style = self.style & 0b11111111
+        foreground = background = foreground_reset = background_reset = ""
 
         if self.foreground is not None:
-            result.appendleft(ESCSEQ["foreground"][self.foreground])
-            result.append(ESCSEQ["reset"]["foreground"])
+            foreground = self.foreground.foreground_seq
+            foreground_reset = ESCSEQ["reset"]["foreground"]
 
         if self.background is not None:
-            result.appendleft(ESCSEQ["background"][self.background])
-            result.append(ESCSEQ["reset"]["background"])
-
-        result.appendleft(" " * self._padding[0])
-        result.append(" " * self._padding[1])
-
-        return "".join(result)
+            background = self.background.background_seq
+            background_reset = ESCSEQ["reset"]["background"]
+
+        return "".join(
+            (
+                _pad_str(self._padding[0]),
+                background,
+                foreground,
+                _STYLE_PREFIX[style],
+                text,
+                _STYLE_SUFFIX[style],
+                foreground_reset,
+                background_reset,
+                _pad_str(self._padding[1]),
+            )
+        )
 
     @abstractmethod
     def __str__(self) -> str:
@@ -210,8 +301,18 @@ class AbstractBaseContainer(ABC):
 
 
 class Span(AbstractBaseContainer):
+    """
+    Spans created by `Span.of` are frozen and shared: mutators called on
+    them leave them untouched and return a modified copy instead, while
+    assigning their attributes raises `AttributeError`.
+    """
+
+    __slots__ = ("_cached", "_cached_key")
+
     _data: str
     _padding: tuple[int, int]
+    _cached: str | None
+    _cached_key: tuple[Any, ...] | None
     style: int
     foreground: Color | None
     background: Color | None
@@ -233,6 +334,8 @@ class Span(AbstractBaseContainer):
             self.style = style if style != 0b00000000 else seq.style
             self.foreground = foreground if foreground is not None else seq.foreground
             self.background = background if background is not None else seq.background
+            self._cached = None
+            self._cached_key = None
             return
         if isinstance(seq, Div):
             raise ValueError("cannot convert a `Div` instance to `Span`")
@@ -243,12 +346,43 @@ class Span(AbstractBaseContainer):
         self.style = style
         self.foreground = foreground
         self.background = background
+        self._cached = None
+        self._cached_key = None
+
+    @staticmethod
+    def of(
+        seq: Any,
+        style: int = 0b00000000,
+        foreground: Color | None = None,
+        background: Color | None = None,
+        padding: tuple[int, int] = (0, 0),
+    ) -> "Span":
+        """
+        Return a frozen `Span`, shared by every call that renders the
+        same: `seq` is compared by its string form.
+        """
+        if isinstance(seq, (Span, Div)):
+            raise ValueError("cannot share a `Span` or `Div` instance")
+        if padding[0] < 0 or padding[1] < 0:
+            raise ValueError("padding cannot be negative")
+        return _frozen_span(
+            str(seq), style, foreground, background, (padding[0], padding[1])
+        )
+
+    def _writable(self) -> Self:
+        self._cached = None
+        return self
 
     def _data_len(self) -> int:
         return len(self._data)
 
     def __str__(self) -> str:
-        return self._style(self._data)
+        # the key catches direct assignment to the public attributes
+        key = (self.style, self.foreground, self.background, self._padding)
+        if self._cached is None or key != self._cached_key:
+            self._cached = self._style(self._data)
+            self._cached_key = key
+        return self._cached
 
     def clone(self) -> Self:
         return copy.copy(self)
@@ -262,13 +396,12 @@ class Span(AbstractBaseContainer):
         return will hold a reference to the `other` object.
         For safety reasons, `other` should no longer be used.
         """
-        cls = type(self)
         div = Div()
         div.append(self)
-        if isinstance(other, cls):
+        if isinstance(other, Span):
             div.append(other)
             return div
-        div.append(cls(other))
+        div.append(Span(other))
         return div
 
     def __radd__(self, other: Any) -> "Div":
@@ -276,19 +409,69 @@ class Span(AbstractBaseContainer):
         `Other` can be anything but a `Span` or `Div` instance.
         Please refer to `Div.__add__` for reverse adding a `Div` instance.
         """
-        cls = type(self)
         div = Div()
-        div.append(cls(other))
+        div.append(Span(other))
         div.append(self)
         return div
 
     def __mul__(self, n: int) -> "Div":
+        """
+        Return will hold `n` references to `self` rather than copies,
+        so changing any of them changes all.
+        For independent spans, `clone` them instead.
+        """
         div = Div()
-        for _ in range(n):
-            div.append(self.clone())
+        div.extend([self] * n)
         return div
 
 
+class _FrozenSpan(Span):
+    """A `Span` shared through `Span.of`, which must never change."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in ("_cached", "_cached_key"):
+            raise AttributeError("cannot modify a frozen `Span`")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            Span.of,
+            (self._data, self.style, self.foreground, self.background, self._padding),
+        )
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def _writable(self) -> Span:
+        return Span(self)
+
+    def clone(self) -> Span:
+        """Return a mutable copy."""
+        span = Span(self)
+        span._cached = self._cached
+        span._cached_key = self._cached_key
+        return span
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _frozen_span(
+    seq: str,
+    style: int,
+    foreground: Color | None,
+    background: Color | None,
+    padding: tuple[int, int],
+) -> _FrozenSpan:
+    span = Span(seq, style, foreground, background)
+    span._padding = padding
+    span.__class__ = _FrozenSpan
+    return span
+
+
 class Div(AbstractBaseContainer):
     """
     Container of `Span` instances.
@@ -296,10 +479,17 @@ class Div(AbstractBaseContainer):
     Any change made will reset the attribute `_padding`,
     therefore `center`, `ljust`, 'rjust' should always
     be the last method(s) to be called, if needed.
+
+    The total length of the contained spans is kept up to date by the
+    methods below, so a `Span` should not be resized (`center`, `ljust`,
+    `rjust`) after it has been added, but rather before.
     """
 
+    __slots__ = ("_len_cache",)
+
     _data: deque[Span]
     _padding: tuple[int, int]
+    _len_cache: int
     style: int
     foreground: Color | None
     background: Color | None
@@ -311,18 +501,17 @@ class Div(AbstractBaseContainer):
         background: Color | None = None,
     ) -> None:
         self._data = deque()
+        self._padding = (0, 0)
+        self._len_cache = 0
         self.style = style
         self.foreground = foreground
         self.background = background
 
     def _data_len(self) -> int:
-        length = 0
-        for i in self._data:
-            length += i.len()
-        return length
+        return self._len_cache
 
     def __str__(self) -> str:
-        text = "".join(str(i) for i in self._data)
+        text = "".join([str(i) for i in self._data])
         return self._style(text)
 
     def __iter__(self) -> Iterator[Span]:
@@ -338,6 +527,7 @@ class Div(AbstractBaseContainer):
         """
         self._reset_padding()
         self._data.append(item)
+        self._len_cache += item.len()
         return self
 
     def appendleft(self, item: Span) -> Self:
@@ -347,11 +537,13 @@ class Div(AbstractBaseContainer):
         """
         self._reset_padding()
         self._data.appendleft(item)
+        self._len_cache += item.len()
         return self
 
     def insert(self, index, item: Span) -> Self:
         self._reset_padding()
         self._data.insert(index, item)
+        self._len_cache += item.len()
         return self
 
     def extend(self, other: Self | Iterable[Span]) -> Self:
@@ -361,24 +553,32 @@ class Div(AbstractBaseContainer):
         """
         self._reset_padding()
         if isinstance(other, type(self)):
-            self._data.append(Span(" " * other._padding[0]))
+            self._data.append(Span(_pad_str(other._padding[0])))
             self._data.extend(other._data)
-            self._data.append(Span(" " * other._padding[1]))
+            self._data.append(Span(_pad_str(other._padding[1])))
+            self._len_cache += other.len()
             return self
-        self._data.extend(other)
+        items = list(other)
+        self._data.extend(items)
+        self._len_cache += sum(item.len() for item in items)
         return self
 
     def pop(self) -> Span:
         self._reset_padding()
-        return self._data.pop()
+        item = self._data.pop()
+        self._len_cache -= item.len()
+        return item
 
     def popleft(self) -> Span:
         self._reset_padding()
-        return self._data.popleft()
+        item = self._data.popleft()
+        self._len_cache -= item.len()
+        return item
 
     def remove(self, item) -> Self:
         self._reset_padding()
         self._data.remove(item)
+        self._len_cache -= item.len()
         return self
 
     def __add__(self, other: Any) -> Self:
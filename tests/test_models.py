@@ -0,0 +1,163 @@
+import copy
+import pickle
+
+import pytest
+
+from termstr import BOLD, DIM, INVISIBLE, UNDERLINE, Color, Div, Span
+
+
+def test_bold_and_dim_share_one_reset():
+    assert str(Span("x", BOLD | DIM)) == "\x1b[2m\x1b[1mx\x1b[22m"
+    assert str(Span("x", DIM)) == "\x1b[2mx\x1b[22m"
+
+
+def test_styles_open_low_bit_first_and_close_high_bit_first():
+    assert str(Span("x", 0b10110101)) == (
+        "\x1b[9m\x1b[7m\x1b[4m\x1b[3m\x1b[1m"
+        "x"
+        "\x1b[22m\x1b[23m\x1b[24m\x1b[27m\x1b[29m"
+    )
+    assert str(Span("x", INVISIBLE)) == "\x1b[8mx\x1b[28m"
+
+
+def test_padding_wraps_colors_which_wrap_styles():
+    span = Span("x", BOLD, Color.RED, Color.BLUE).center(4)
+    assert str(span) == " \x1b[44m\x1b[31m\x1b[1mx\x1b[22m\x1b[39m\x1b[49m  "
+
+
+def test_color_sequences():
+    assert Color.RED.foreground_seq == "\x1b[31m"
+    assert Color.BLUE.background_seq == "\x1b[44m"
+    for color in Color:
+        assert str(Span("x", foreground=color)) == f"{color.foreground_seq}x\x1b[39m"
+        assert str(Span("x", background=color)) == f"{color.background_seq}x\x1b[49m"
+
+
+def test_style_ignores_bits_above_the_low_byte():
+    assert str(Span("x", style=0x100 | BOLD)) == str(Span("x", style=BOLD))
+    assert str(Span("x", style=0x100)) == "x"
+
+
+def test_assigning_attributes_refreshes_rendered_string():
+    span = Span("x")
+    assert str(span) == "x"
+    span.style = BOLD
+    assert str(span) == str(Span("x", style=BOLD))
+    span.foreground = Color.RED
+    assert str(span) == str(Span("x", BOLD, Color.RED))
+
+
+def test_rendered_string_is_reused_until_state_changes():
+    for span in (Span("-", BOLD), Span.of("-", BOLD)):
+        rendered = str(span)
+        Div().append(span).extend([span])
+        assert str(span) is rendered
+
+
+def test_mutators_refresh_rendered_string():
+    span = Span("x")
+    assert str(span) == "x"
+    assert str(span.set_bold()) == str(Span("x", style=BOLD))
+    assert str(span.rjust(3)) == "  " + str(Span("x", style=BOLD))
+
+
+def test_div_length_counts_spans_resized_before_adding():
+    div = Div().append(Span("ab").center(10)).append(Span("c"))
+    assert len(div) == len(str(div)) == 11
+    div.rjust(15)
+    assert len(div) == len(str(div)) == 15
+
+
+def test_div_length_tracks_mutators():
+    inner = Div().append(Span("xy")).center(6)
+    div = Div().extend([Span("ab"), Span("c")]).extend(inner)
+    assert len(div) == len(str(div)) == 9
+    div.pop()
+    div.popleft()
+    assert len(div) == len(str(div)) == 5
+
+
+def test_set_and_unset_stay_within_one_byte():
+    span = Span("x").set(0x100 | BOLD, UNDERLINE)
+    assert span.style == BOLD | UNDERLINE
+    assert str(span) == str(Span("x", BOLD | UNDERLINE))
+    assert span.unset(BOLD).style == UNDERLINE
+
+
+def test_of_returns_shared_instance_for_identical_arguments():
+    assert Span.of("-", BOLD) is Span.of("-", BOLD)
+    assert Span.of("-", BOLD) is not Span.of("-")
+    assert Span.of("a", 0) is Span.of("a")
+    assert Span.of("a", style=BOLD) is Span.of("a", BOLD)
+    assert Span.of("a", padding=[1, 0]) is Span.of("a", 0, None, None, (1, 0))
+
+
+def test_of_rejects_containers():
+    with pytest.raises(ValueError):
+        Span.of(Span("m"))
+    with pytest.raises(ValueError):
+        Span.of(Div())
+
+
+def test_of_distinguishes_equal_arguments_of_different_types():
+    assert str(Span.of(1)) == "1"
+    assert str(Span.of(True)) == "True"
+    assert str(Span.of(1.0)) == "1.0"
+
+
+def test_of_rejects_negative_padding():
+    with pytest.raises(ValueError):
+        Span.of("x", padding=(-1, 0))
+    span = Span.of("x", padding=(1, 2))
+    assert len(span) == len(str(span)) == 4
+
+
+def test_mutating_frozen_span_returns_a_copy():
+    shared = Span.of("q")
+    bold = shared.set_bold()
+    assert bold is not shared
+    assert bold.style == BOLD
+    assert shared.style == 0
+    assert str(shared) == "q"
+    assert shared.center(5) is not shared
+    assert len(shared) == 1
+
+
+def test_assigning_attributes_of_frozen_span_raises():
+    shared = Span.of("q")
+    with pytest.raises(AttributeError):
+        shared.style = BOLD
+    with pytest.raises(AttributeError):
+        shared._frozen = False
+    assert str(Span.of("q")) == "q"
+
+
+def test_clone_of_frozen_span_is_mutable():
+    shared = Span.of("q", BOLD)
+    clone = shared.clone()
+    assert clone is not shared
+    assert clone.set_underline() is clone
+    clone.style = 0
+    assert str(clone) == "q"
+    assert shared.style == BOLD
+
+
+def test_div_holding_frozen_spans_can_be_cloned():
+    div = Span.of("-") * 3 + Span("x")
+    clone = div.clone()
+    assert str(clone) == str(div) == "---x"
+    spans = list(clone)
+    assert spans[0] is Span.of("-")
+    assert spans[-1] is not list(div)[-1]
+    assert len(clone) == 4
+
+
+def test_frozen_span_survives_pickle_and_copy():
+    shared = Span.of("x", BOLD, Color.RED, padding=(1, 0))
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(shared, protocol)) is shared
+    assert copy.copy(shared) is shared
+    assert copy.deepcopy(shared) is shared
+    div = pickle.loads(pickle.dumps(Span.of("-") * 2 + Span("x")))
+    assert str(div) == "--x"
+    assert list(div)[0] is Span.of("-")